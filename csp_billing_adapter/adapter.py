@@ -16,13 +16,18 @@
 
 """Core event loop for csp-billing-adapter."""
 
+import asyncio
 import datetime
-import functools
+import importlib.metadata
+import json
 import logging
 import os
+import signal
 import sys
 import time
-import traceback
+import types
+
+from concurrent.futures import ThreadPoolExecutor
 
 import pluggy
 
@@ -57,8 +62,124 @@ LOGGER_NAME = 'CSPBillingAdapter'
 LOGGING_FORMAT = '%(asctime)s.%(msecs)03d|%(levelname)s|%(name)s|%(message)s'
 LOGGING_DATE_FMT = '%Y-%m-%dT%H:%M:%S'
 DEFAULT_CONFIG_PATH = '/etc/csp_billing_adapter/config.yaml'
+DEFAULT_VERSIONS_CACHE_PATH = '/var/lib/csp_billing_adapter/versions.cache'
 
 config_path = os.environ.get('CSP_ADAPTER_CONFIG_FILE') or DEFAULT_CONFIG_PATH
+versions_cache_path = (
+    os.environ.get('CSP_ADAPTER_VERSIONS_CACHE') or
+    DEFAULT_VERSIONS_CACHE_PATH
+)
+
+# hooks that are called on every event loop iteration, either directly
+# in event_loop_handler() or transitively via process_metering() and
+# archive_record().
+HOT_LOOP_HOOKS = (
+    'get_usage_data',
+    'get_metering_archive',
+    'save_metering_archive',
+    'update_cache',
+    'update_csp_config',
+    'update_csp_config_raw',
+    'meter_billing',
+)
+
+# pool used to overlap the independent datastore backup writes that
+# are performed at the end of every event loop iteration.
+_io_pool = ThreadPoolExecutor(max_workers=2)
+
+# maximum number of consecutive event loop iterations for which a
+# datastore backup of an otherwise unchanged csp_config can be
+# skipped before a write is forced to refresh the stored timestamp.
+MAX_SKIPPED_CSP_CONFIG_WRITES = 10
+
+_last_csp_config_hash = None
+_skipped_csp_config_writes = 0
+
+
+def csp_config_changed(csp_config: dict) -> bool:
+    """
+    Check whether the csp_config needs to be backed up to the datastore.
+
+    On most event loop iterations nothing but the timestamp in the
+    csp_config changes, so backing it up to the datastore every time
+    serializes and writes the same content over and over. Track a hash
+    of the persistent-significant fields and report the csp_config as
+    unchanged when the hash matches the last backed up state. A backup
+    is still requested at least once every
+    MAX_SKIPPED_CSP_CONFIG_WRITES iterations so that the stored
+    timestamp doesn't go overly stale.
+
+    :param csp_config: The csp_config data store contents to check.
+    :return: True if the csp_config should be backed up, False if not.
+    """
+    global _last_csp_config_hash, _skipped_csp_config_writes
+
+    try:
+        csp_config_hash = hash(json.dumps(
+            {
+                key: value for key, value in csp_config.items()
+                if key != 'timestamp'
+            },
+            sort_keys=True,
+            default=str
+        ))
+    except Exception:
+        # content that cannot be serialized for comparison is always
+        # treated as changed
+        _last_csp_config_hash = None
+        return True
+
+    if (
+        csp_config_hash == _last_csp_config_hash and
+        _skipped_csp_config_writes < MAX_SKIPPED_CSP_CONFIG_WRITES
+    ):
+        _skipped_csp_config_writes += 1
+        return False
+
+    _last_csp_config_hash = csp_config_hash
+    _skipped_csp_config_writes = 0
+    return True
+
+
+def reset_csp_config_hash() -> None:
+    """
+    Forget the last recorded csp_config content hash.
+
+    csp_config_changed() records the new hash when it requests a
+    backup, before the datastore write has run; if that write fails
+    the recorded hash describes content that was never persisted.
+    Calling this makes the next csp_config_changed() check report the
+    csp_config as changed, so the backup is retried on the following
+    event loop iteration.
+    """
+    global _last_csp_config_hash, _skipped_csp_config_writes
+
+    _last_csp_config_hash = None
+    _skipped_csp_config_writes = 0
+
+
+def hook_is_implemented(hook_caller) -> bool:
+    """
+    Check whether at least one implementation is registered for the
+    given hook caller.
+
+    Callers that have already been resolved to a direct function by
+    get_hot_hook_callers() are implemented by definition; for regular
+    pluggy hook callers the registered implementations are inspected.
+
+    :param hook_caller: The hook caller, or resolved function, to check.
+    :return: True if calling the hook will invoke an implementation.
+    """
+    get_impls = getattr(hook_caller, 'get_hookimpls', None)
+
+    if get_impls is None:
+        # a direct function resolved by get_hot_hook_callers()
+        return True
+
+    try:
+        return len(get_impls()) > 0
+    except Exception:
+        return False
 
 
 def get_plugin_manager() -> pluggy.PluginManager:
@@ -78,6 +199,48 @@ def get_plugin_manager() -> pluggy.PluginManager:
     return pm
 
 
+def get_hot_hook_callers(pm: pluggy.PluginManager) -> types.SimpleNamespace:
+    """
+    Resolve direct callers for the hooks used in the event loop.
+
+    Every pm.hook.<name>() call is routed through several layers of
+    pluggy dispatch machinery, and the set of registered hook
+    implementations is fixed once get_plugin_manager() has returned.
+    For a firstresult hook with exactly one registered implementation,
+    and no hook wrappers, the implementing function can safely be
+    called directly, avoiding that dispatch overhead on every event
+    loop iteration. Hooks that don't qualify, or that cannot be
+    introspected, fall back to the regular pluggy hook caller.
+
+    :param pm: The configured pluggy.PluginManager instance.
+    :return:
+        A namespace providing a caller for each hook named in
+        HOT_LOOP_HOOKS.
+    """
+    callers = {}
+
+    for name in HOT_LOOP_HOOKS:
+        hook_caller = getattr(pm.hook, name)
+
+        try:
+            impls = hook_caller.get_hookimpls()
+            use_direct_call = (
+                hook_caller.spec.opts.get('firstresult') and
+                len(impls) == 1 and
+                not impls[0].hookwrapper and
+                not impls[0].wrapper and
+                set(impls[0].argnames) == set(hook_caller.spec.argnames)
+            )
+        except Exception:
+            # introspection of the hook caller failed; use the
+            # regular pluggy dispatch path for this hook.
+            use_direct_call = False
+
+        callers[name] = impls[0].function if use_direct_call else hook_caller
+
+    return types.SimpleNamespace(**callers)
+
+
 def setup_logging() -> logging.Logger:
     """Setup basic logging"""
     logging.basicConfig(
@@ -114,7 +277,14 @@ def get_config(
 def update_logger_from_config(config: Config, log: logging.Logger):
     """Update the logger based on configuration file options."""
     current_level = log.getEffectiveLevel()
-    log.setLevel(config.get('logging', {}).get('level', current_level))
+
+    # Config resolves the nested logging level setting once at load
+    # time; fall back to the dict walk for plain dict configs
+    logging_level = getattr(config, 'logging_level', None)
+    if logging_level is None:
+        logging_level = config.get('logging', {}).get('level', current_level)
+
+    log.setLevel(logging_level)
 
     if current_level != log.getEffectiveLevel():
         log.info(
@@ -122,6 +292,55 @@ def update_logger_from_config(config: Config, log: logging.Logger):
         )
 
 
+def get_plugin_versions(hook, log: logging.Logger) -> dict:
+    """
+    Determine the versions of the registered plugins.
+
+    Plugin versions only change when a package is installed or
+    upgraded, so the result of the get_version() hook dispatch is
+    cached on disk, keyed by the installed csp-billing-adapter
+    distributions. Subsequent process starts against an unchanged
+    installation reuse the cached result rather than re-dispatching
+    the hook. The cache is best effort: any problem reading or
+    writing it falls back to calling the hook.
+    """
+    signature = sorted(
+        [dist.metadata['Name'], dist.version]
+        for dist in importlib.metadata.distributions()
+        if (dist.metadata['Name'] or '').startswith('csp-billing-adapter')
+    )
+
+    try:
+        with open(versions_cache_path, 'r', encoding='utf-8') as cache_file:
+            cached = json.load(cache_file)
+
+        if cached.get('signature') == signature:
+            log.debug(
+                "Using cached plugin versions: %s",
+                cached['versions']
+            )
+            return cached['versions']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    versions = dict(hook.get_version() or ())
+
+    try:
+        os.makedirs(os.path.dirname(versions_cache_path), exist_ok=True)
+        with open(versions_cache_path, 'w', encoding='utf-8') as cache_file:
+            json.dump(
+                {'signature': signature, 'versions': versions},
+                cache_file
+            )
+    except OSError as exc:
+        log.debug(
+            "Unable to persist plugin versions cache: %s",
+            str(exc)
+        )
+
+    return versions
+
+
 def initial_adapter_setup(
     hook,
     config: Config,
@@ -129,26 +348,45 @@ def initial_adapter_setup(
 ) -> (dict, dict):
     """Initial setup before starting event loop."""
 
+    # bind the hook callers used during setup once, rather than
+    # repeating the relay attribute lookup at each call site
+    setup_adapter = hook.setup_adapter
+    get_csp_config = hook.get_csp_config
+    get_account_info = hook.get_account_info
+    save_csp_config = hook.save_csp_config
+    get_cache = hook.get_cache
+
     log.debug("Setting up the adapter via hook")
     retry_on_exception(
-        functools.partial(
-            hook.setup_adapter,
-            config=config
-        ),
+        setup_adapter,
+        func_kwargs={'config': config},
         logger=log,
         func_name="hook.setup_adapter"
     )
 
+    # the csp_config and cache retrievals are independent of each
+    # other, so issue both concurrently to reduce cold start latency
+    # to roughly that of the slower call.
     log.debug("Initializing the csp_config")
+    csp_config_future = _io_pool.submit(
+        retry_on_exception,
+        get_csp_config,
+        func_kwargs={'config': config},
+        logger=log,
+        func_name="hook.get_csp_config"
+    )
+
+    log.debug("Initializing the cache")
+    cache_future = _io_pool.submit(
+        retry_on_exception,
+        get_cache,
+        func_kwargs={'config': config},
+        logger=log,
+        func_name="hook.get_cache"
+    )
+
     try:
-        csp_config = retry_on_exception(
-            functools.partial(
-                hook.get_csp_config,
-                config=config
-            ),
-            logger=log,
-            func_name="hook.get_csp_config"
-        )
+        csp_config = csp_config_future.result()
     except Exception as e:
         log.debug(
             "Failed to retrieve existing CSP config: %s",
@@ -158,10 +396,8 @@ def initial_adapter_setup(
 
     if not csp_config:
         account_info = retry_on_exception(
-            functools.partial(
-                hook.get_account_info,
-                config=config
-            ),
+            get_account_info,
+            func_kwargs={'config': config},
             logger=log,
             func_name="hook.get_account_info"
         )
@@ -173,17 +409,14 @@ def initial_adapter_setup(
         )
 
     # Update csp-config with latest plugin versions
-    versions = hook.get_version()
+    versions = get_plugin_versions(hook, log)
     if versions:
-        csp_config['versions'] = dict(versions)
+        csp_config['versions'] = versions
 
     try:
         retry_on_exception(
-            functools.partial(
-                hook.save_csp_config,
-                config=config,
-                csp_config=csp_config
-            ),
+            save_csp_config,
+            func_kwargs={'config': config, 'csp_config': csp_config},
             logger=log,
             func_name="hook.save_csp_config"
         )
@@ -194,16 +427,8 @@ def initial_adapter_setup(
         log.error("Unable to save CSP config: %s", str(exc))
         raise FailedToSaveCSPConfigError(str(exc)) from exc
 
-    log.debug("Initializing the cache")
     try:
-        cache = retry_on_exception(
-            functools.partial(
-                hook.get_cache,
-                config=config
-            ),
-            logger=log,
-            func_name="hook.get_cache"
-        )
+        cache = cache_future.result()
     except Exception as e:
         log.debug(
             "Failed to retrieve existing cache: %s",
@@ -231,14 +456,17 @@ def event_loop_handler(
 ) -> None:
     """Perform the event loop processing actions."""
     log.info('Starting event loop processing')
-    csp_config['errors'] = []
+    now_string = date_to_string(now)
+
+    # clear the errors list in place, keeping the same list object
+    # rather than allocating a replacement every iteration
+    errors = csp_config.setdefault('errors', [])
+    errors.clear()
 
     try:
         usage = retry_on_exception(
-            functools.partial(
-                hook.get_usage_data,
-                config=config
-            ),
+            hook.get_usage_data,
+            func_kwargs={'config': config},
             logger=log,
             func_name="hook.get_usage_data"
         )
@@ -246,18 +474,23 @@ def event_loop_handler(
     except Exception as exc:
         usage = None
         log.warning("Failed to retrieve usage data: %s", str(exc))
-        csp_config['errors'].append(f'Usage data retrieval failed: {exc}')
+        errors.append(f'Usage data retrieval failed: {exc}')
 
     if usage:
-        add_usage_record(usage, cache, config.billing_interval)
-        csp_config['base_product'] = usage.get('base_product', '')
+        # a plugin may buffer multiple usage samples between iterations
+        # and return them as a list; drain the whole batch in one go
+        # rather than one sample per iteration.
+        usage_samples = usage if isinstance(usage, list) else [usage]
+
+        for usage_sample in usage_samples:
+            add_usage_record(usage_sample, cache, config.billing_interval)
+
+        csp_config['base_product'] = usage_samples[-1].get('base_product', '')
 
     try:
         archive = retry_on_exception(
-            functools.partial(
-                hook.get_metering_archive,
-                config=config,
-            ),
+            hook.get_metering_archive,
+            func_kwargs={'config': config},
             logger=log,
             func_name='hook.get_metering_archive'
         )
@@ -269,7 +502,7 @@ def event_loop_handler(
 
     log.debug(
         "Now: %s, Next Reporting Time: %s, Next Bill Time: %s",
-        date_to_string(now),
+        now_string,
         cache['next_reporting_time'],
         cache['next_bill_time']
     )
@@ -283,7 +516,7 @@ def event_loop_handler(
                 'Usage will be billed for the previous cycle.'
             )
             log.warning(msg)
-            csp_config['errors'].append(msg)
+            errors.append(msg)
 
         if trial_remaining > 0 and len(archive) == 0:
             log.info('Attempt a free trial billing cycle update')
@@ -316,43 +549,75 @@ def event_loop_handler(
             empty_metering=True
         )
 
-    # Backup cache to datastore
+    csp_config['timestamp'] = now_string
+
+    # Backup cache and csp-config to the datastore; the cache write
+    # is submitted to the I/O pool so it overlaps with the remaining
+    # main thread work, but is resolved before the csp_config backup
+    # starts so that a cache save failure lands in the errors list
+    # persisted this iteration and the csp_config is no longer
+    # mutated once a worker thread may be serializing it.
+
+    # formatting the full cache and csp_config contents gets costly
+    # as usage_records grows, so only log them at debug level
+    log.debug("Updating cache with: %s", cache)
+    cache_future = _io_pool.submit(
+        retry_on_exception,
+        hook.update_cache,
+        func_kwargs={'config': config, 'cache': cache, 'replace': False},
+        logger=log,
+        func_name="hook.update_cache"
+    )
+
+    raw_caller = getattr(hook, 'update_csp_config_raw', None)
 
-    log.info("Updating cache with: %s", cache)
-    try:
-        retry_on_exception(
-            functools.partial(
-                hook.update_cache,
-                config=config,
-                cache=cache,
-                replace=False
-            ),
+    error = cache_future.exception()
+    if error:
+        log.warning("Failed to save cache to datastore: %s", str(error))
+        errors.append(f'Cache failed to save: {error}')
+
+    if not csp_config_changed(csp_config):
+        log.debug("CSP config unchanged, skipping datastore backup")
+        csp_config_future = None
+    elif raw_caller is not None and hook_is_implemented(raw_caller):
+        # serialize once and hand the bytes to the storage plugin,
+        # instead of both the log formatting and the plugin encoding
+        # the same content separately
+        raw_csp_config = json.dumps(csp_config, default=str).encode()
+        log.debug("Updating CSP config with: %s", raw_csp_config)
+        csp_config_future = _io_pool.submit(
+            retry_on_exception,
+            raw_caller,
+            func_kwargs={
+                'config': config,
+                'raw_csp_config': raw_csp_config,
+                'replace': False
+            },
             logger=log,
-            func_name="hook.update_cache"
+            func_name="hook.update_csp_config_raw"
         )
-    except Exception as error:
-        log.warning("Failed to save cache to datastore: %s", str(error))
-        csp_config['errors'].append(f'Cache failed to save: {error}')
-
-    csp_config['timestamp'] = date_to_string(now)
-
-    # Backup csp-config to datastore
-
-    log.info("Updating CSP config with: %s", csp_config)
-    try:
-        retry_on_exception(
-            functools.partial(
-                hook.update_csp_config,
-                config=config,
-                csp_config=csp_config,
-                replace=False
-            ),
+    else:
+        log.debug("Updating CSP config with: %s", csp_config)
+        csp_config_future = _io_pool.submit(
+            retry_on_exception,
+            hook.update_csp_config,
+            func_kwargs={
+                'config': config,
+                'csp_config': csp_config,
+                'replace': False
+            },
             logger=log,
             func_name="hook.update_csp_config"
         )
-    except Exception as error:
+
+    error = csp_config_future.exception() if csp_config_future else None
+    if error:
         log.warning("Failed to save csp_config to datastore: %s", str(error))
-        csp_config['errors'].append(f'csp_config failed to save: {error}')
+        errors.append(f'csp_config failed to save: {error}')
+        # the datastore still holds the previous content, so forget
+        # the hash recorded above and retry the backup next iteration
+        # even if the csp_config is otherwise unchanged
+        reset_csp_config_hash()
 
     log.info('Finishing event loop processing')
 
@@ -374,19 +639,25 @@ def metering_test(
         # perform the metering test, catching and re-raising any
         # handled exceptions appropriately.
         try:
-            metric = next(iter(config.usage_metrics))
-            dimension = next(iter(
-                config.usage_metrics[metric]['dimensions']
-            ))['dimension']
+            # the dimension used for the dry-run metering is fixed by
+            # the config, so determine it once and cache it for any
+            # subsequent invocations
+            dimension = getattr(config, '_metering_test_dimension', None)
+            if dimension is None:
+                metric = next(iter(config.usage_metrics))
+                dimension = next(iter(
+                    config.usage_metrics[metric]['dimensions']
+                ))['dimension']
+                config._metering_test_dimension = dimension
 
             retry_on_exception(
-                functools.partial(
-                    hook.meter_billing,
-                    config=config,
-                    dimensions={dimension: 0},
-                    timestamp=get_now(),
-                    dry_run=True
-                ),
+                hook.meter_billing,
+                func_kwargs={
+                    'config': config,
+                    'dimensions': {dimension: 0},
+                    'timestamp': get_now(),
+                    'dry_run': True
+                },
                 logger=log,
                 func_name="hook.meter_billing"
             )
@@ -411,12 +682,12 @@ def metering_test(
 
         try:
             retry_on_exception(
-                functools.partial(
-                    hook.update_csp_config,
-                    config=config,
-                    csp_config=csp_config,
-                    replace=False
-                ),
+                hook.update_csp_config,
+                func_kwargs={
+                    'config': config,
+                    'csp_config': csp_config,
+                    'replace': False
+                },
                 logger=log,
                 func_name="hook.update_csp_config"
             )
@@ -429,51 +700,105 @@ def metering_test(
         raise
 
 
+async def run_event_loop(
+    hook,
+    config: Config,
+    log: logging.Logger,
+    cache: dict,
+    csp_config: dict,
+    initial_deploy: bool
+) -> None:
+    """
+    Run the adapter's periodic processing under asyncio.
+
+    The registered hook implementations are synchronous, so each
+    iteration is executed in a worker thread, keeping the asyncio
+    event loop itself responsive to signals. A SIGTERM handler is
+    installed so that a service manager initiated stop terminates
+    the adapter cleanly after the in-progress iteration.
+    """
+    loop = asyncio.get_running_loop()
+    shutdown = asyncio.Event()
+
+    try:
+        loop.add_signal_handler(signal.SIGTERM, shutdown.set)
+    except (NotImplementedError, RuntimeError):
+        # signal handlers may be unsupported on this platform or
+        # when not running in the main thread
+        pass
+
+    if initial_deploy:
+        # wait 1 cycle for usage data
+        await asyncio.sleep(config.query_interval)
+
+    while not shutdown.is_set():
+        # pace the loop against an absolute monotonic deadline so
+        # that it is unaffected by wall clock adjustments and does
+        # not drift by the per-iteration processing time.
+        deadline = time.monotonic() + config.query_interval
+        start = get_now()
+        await loop.run_in_executor(
+            None,
+            event_loop_handler,
+            hook,
+            config,
+            log,
+            start,
+            cache,
+            csp_config
+        )
+        log.info("Processed event loop at %s", date_to_string(start))
+
+        query_interval_remainder = deadline - time.monotonic()
+        if query_interval_remainder > 0 and not shutdown.is_set():
+            log.debug("Sleeping for %g seconds", query_interval_remainder)
+            await asyncio.sleep(query_interval_remainder)
+
+    log.info("Terminating on shutdown request")
+
+
 def main() -> None:
     """
     Main routine, implementing the event loop for the csp_billing_adapter.
     """
     pm = get_plugin_manager()
 
+    # bind the hook relay once; every pm.hook access goes through
+    # the relay's __getattr__
+    hook = pm.hook
+
     try:
         log = setup_logging()
 
         config = get_config(
             config_path,
-            pm.hook,
+            hook,
             log
         )
 
         update_logger_from_config(config, log)
 
         cache, csp_config, initial_deploy = initial_adapter_setup(
-            pm.hook,
+            hook,
             config,
             log
         )
 
-        metering_test(pm.hook, config, log, csp_config)
+        metering_test(hook, config, log, csp_config)
 
-        if initial_deploy:
-            time.sleep(config.query_interval)  # wait 1 cycle for usage data
+        # resolve the per-iteration hook callers once, outside the loop
+        hot_hooks = get_hot_hook_callers(pm)
 
-        while True:
-            start = get_now()
-            event_loop_handler(
-                pm.hook,
+        asyncio.run(
+            run_event_loop(
+                hot_hooks,
                 config,
                 log,
-                start,
                 cache,
-                csp_config
-            )
-            log.info("Processed event loop at %s", date_to_string(start))
-
-            query_interval_remainder = (
-                config.query_interval - (get_now() - start).total_seconds()
+                csp_config,
+                initial_deploy
             )
-            log.debug("Sleeping for %g seconds", query_interval_remainder)
-            time.sleep(query_interval_remainder)
+        )
     except KeyboardInterrupt:
         sys.exit(0)
     except SystemExit as e:
@@ -481,13 +806,11 @@ def main() -> None:
         sys.exit(e)
     except CSPBillingAdapterException as e:
         # csp_billing_adapter specific exception
-        log.error('CSP Billing Adapter error: {0}'.format(e))
-        traceback.print_exc()
+        log.exception('CSP Billing Adapter error: %s', e)
         sys.exit(2)
     except Exception as e:
         # exception we did no expect, show python backtrace
-        log.error('Unexpected error: {0}'.format(e))
-        traceback.print_exc()
+        log.exception('Unexpected error: %s', e)
         sys.exit(1)
 
 
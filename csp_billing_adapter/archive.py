@@ -20,18 +20,47 @@ import functools
 import logging
 import json
 
+from collections import deque
+
 from csp_billing_adapter.config import Config
 from csp_billing_adapter.utils import retry_on_exception
 
 log = logging.getLogger('CSPBillingAdapter')
 
 
+class _SizeCounter:
+    """
+    File-like object that counts the length of everything written
+    to it, allowing the serialized size of an object to be measured
+    with json.dump() without materializing the JSON string.
+
+    Since json.dump() escapes non-ASCII characters by default
+    (ensure_ascii), the written chunks are pure ASCII and their
+    string length equals their UTF-8 encoded byte length.
+    """
+
+    __slots__ = ('size',)
+
+    def __init__(self):
+        self.size = 0
+
+    def write(self, chunk):
+        self.size += len(chunk)
+
+
+def get_record_size(record: dict) -> int:
+    """Return the serialized JSON size of a record in bytes."""
+    counter = _SizeCounter()
+    json.dump(record, counter)
+    return counter.size
+
+
 def append_metering_records(
     archive: list,
     billing_record: dict,
     max_length: int,
     max_bytes: int
-) -> list:
+) -> deque:
     """
     Append usage and metering records to the archive
 
@@ -49,29 +78,39 @@ def append_metering_records(
     :param max_bytes:
         The max size in bytes of the archive.
     :return:
-        The archive of meterings and usage records with the
-        billing_record appended. If archive ends up greater
-        than max lengh or max bytes the archive is trimmed
-        as necessary to satisfy both max_length and
-        max_bytes.
+        The archive of meterings and usage records, as a deque
+        bounded to max_length, with the billing_record appended.
+        If archive ends up greater than max lengh or max bytes
+        the archive is trimmed as necessary to satisfy both
+        max_length and max_bytes.
     """
-    archive.append(billing_record)
+    if not isinstance(archive, deque):
+        # a bounded deque evicts the oldest record in O(1) on append
+        # and avoids the full-list copy that slicing would incur
+        archive = deque(archive, maxlen=max_length)
 
-    if len(archive) > max_length:
-        archive = archive[1:]
+    archive.append(billing_record)
 
     if max_bytes > 1:
         # Treat 0 and 1 the same. Disable max bytes option.
         # This prevents infitite loop when value is 1 since
         # empty list is 2 bytes.
-        while True:
-            # Trim archive until it is smaller than max bytes
-            archive_size = len(bytes(json.dumps(archive), 'utf-8'))
 
-            if archive_size > max_bytes:
-                archive = archive[1:]
-            else:
-                break
+        # Each record is serialized once and the archive size is
+        # tracked incrementally while trimming, rather than
+        # re-serializing the whole archive after each drop. The
+        # serialized size of the archive list is the sum of the
+        # record sizes plus 2 bytes per record for the enclosing
+        # brackets and the ', ' separators.
+        record_sizes = deque(
+            get_record_size(record) for record in archive
+        )
+        archive_size = sum(record_sizes) + 2 * len(archive)
+
+        while archive_size > max_bytes:
+            # Trim archive until it is smaller than max bytes
+            archive_size -= record_sizes.popleft() + 2
+            archive.popleft()
 
     return archive
 
@@ -122,7 +161,7 @@ def archive_record(
         functools.partial(
             hook.save_metering_archive,
             config=config,
-            archive_data=archive
+            archive_data=list(archive)
         ),
         logger=log,
         func_name="hook.save_metering_archive"
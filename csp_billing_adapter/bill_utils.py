@@ -22,7 +22,8 @@ metrics specified in the provided config.
 import datetime
 import functools
 import logging
-import math
+
+from operator import itemgetter
 
 from csp_billing_adapter.csp_cache import cache_meter_record
 from csp_billing_adapter.exceptions import (
@@ -61,13 +62,19 @@ def get_max_usage(metric: str, usage_records: list) -> int:
         log.debug("No usage records, returning 0")
         return 0
 
-    max_usage = max(record.get(metric, 0) for record in usage_records)
+    try:
+        # itemgetter and max dispatch entirely in C; fall back to the
+        # slower generator with a default should any record lack the
+        # metric
+        max_usage = max(map(itemgetter(metric), usage_records))
+    except KeyError:
+        max_usage = max(record.get(metric, 0) for record in usage_records)
 
     log.info(
-        "Metric: %s, max: %d, records: %s",
-        repr(metric),
+        "Metric: %s, max: %d, record count: %d",
+        metric,
         max_usage,
-        usage_records
+        len(usage_records)
     )
     return max_usage
 
@@ -89,14 +96,24 @@ def get_average_usage(metric: str, usage_records: list) -> int:
         log.debug("No usage records, returning 0")
         return 0
 
-    total_usage = sum(record.get(metric, 0) for record in usage_records)
-    average_usage = math.ceil(total_usage / len(usage_records))
+    try:
+        # itemgetter and sum dispatch entirely in C; fall back to the
+        # slower generator with a default should any record lack the
+        # metric
+        total_usage = sum(map(itemgetter(metric), usage_records))
+    except KeyError:
+        total_usage = sum(record.get(metric, 0) for record in usage_records)
+
+    # ceiling division in pure integer arithmetic; unlike
+    # math.ceil(a / b) this avoids the float conversion and stays
+    # exact for arbitrarily large totals
+    average_usage = -(-total_usage // len(usage_records))
 
     log.info(
-        "Metric: %s, average = %d, records: %s",
-        repr(metric),
+        "Metric: %s, average = %d, record count: %d",
+        metric,
         average_usage,
-        usage_records
+        len(usage_records)
     )
     return average_usage
 
@@ -137,25 +154,70 @@ def get_billable_usage(
     """
     billable_usage = {}
 
+    # the billing plan precomputed at config load avoids re-walking
+    # the nested usage_metrics settings on every call; build it here
+    # for configs that were not created via the Config constructor
+    billing_plan = getattr(config, '_billing_plan', None)
+    if billing_plan is None:
+        billing_plan = tuple(
+            (
+                metric,
+                data.get('usage_aggregation'),
+                data.get('minimum_consumption', 0)
+            )
+            for metric, data in config.usage_metrics.items()
+        )
+
     if empty_usage:
         log.debug("Return 0 for all metrics, empty_usage set")
-        return {metric: 0 for metric in config.usage_metrics}
-
-    for metric, data in config.usage_metrics.items():
-        if data['usage_aggregation'] == 'average':
-            usage = get_average_usage(metric, usage_records)
-        elif data['usage_aggregation'] == 'maximum':
-            usage = get_max_usage(metric, usage_records)
+        return {metric: 0 for metric, _, _ in billing_plan}
+
+    # the metrics are bucketed by aggregation method so that all
+    # metrics are accumulated in a single traversal of the usage
+    # records, rather than one full traversal per metric; the
+    # buckets are precomputed at config load where possible
+    average_metrics = getattr(config, '_average_metrics', None)
+    if average_metrics is None:
+        average_metrics = []
+        maximum_metrics = []
+        for metric, aggregation, _ in billing_plan:
+            if aggregation == 'average':
+                average_metrics.append(metric)
+            elif aggregation == 'maximum':
+                maximum_metrics.append(metric)
+    else:
+        maximum_metrics = config._maximum_metrics
+
+    totals = dict.fromkeys(average_metrics, 0)
+    maximums = dict.fromkeys(maximum_metrics, 0)
+
+    for record in usage_records:
+        get_value = record.get
+        for metric in average_metrics:
+            totals[metric] += get_value(metric, 0)
+        for metric in maximum_metrics:
+            value = get_value(metric, 0)
+            if value > maximums[metric]:
+                maximums[metric] = value
+
+    record_count = len(usage_records)
+
+    for metric, aggregation, minimum_consumption in billing_plan:
+        if metric in totals:
+            if record_count:
+                # integer ceiling division, see get_average_usage()
+                usage = -(-totals[metric] // record_count)
+            else:
+                usage = 0
+        else:
+            usage = maximums[metric]
 
-        billable_usage[metric] = max(
-            usage,
-            data.get('minimum_consumption', 0)
-        )
+        billable_usage[metric] = max(usage, minimum_consumption)
 
     log.info(
-        "Billable usage: %s, records: %s",
+        "Billable usage: %s, record count: %d",
         billable_usage,
-        usage_records
+        len(usage_records)
     )
     return billable_usage
 
@@ -183,13 +245,22 @@ def get_volume_dimensions(
         determined volume dimension's name to the specified usage
         value.
     """
+    # resolve the logging level check once rather than per dimension
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
+
     for dimension in metric_dimensions:
-        if 'min' in dimension and usage < dimension['min']:
-            log.debug("Skipping as usage < min")
+        # a single .get() probe per bound instead of an 'in' check
+        # followed by an item lookup
+        dim_min = dimension.get('min')
+        if dim_min is not None and usage < dim_min:
+            if debug_enabled:
+                log.debug("Skipping as usage < min")
             continue
 
-        if 'max' in dimension and usage > dimension['max']:
-            log.debug("Skipping as usage < min")
+        dim_max = dimension.get('max')
+        if dim_max is not None and usage > dim_max:
+            if debug_enabled:
+                log.debug("Skipping as usage > max")
             continue
 
         billed_dimensions[dimension['dimension']] = usage
@@ -198,7 +269,7 @@ def get_volume_dimensions(
             "Metric: %s=%d, Volume dimension: %s",
             usage_metric,
             usage,
-            billed_dimensions[dimension['dimension']]
+            usage
         )
 
         # All usage is billed in volume to the matching dimension
@@ -246,13 +317,17 @@ def get_tiered_dimensions(
         determined tiered dimension names to the appropriate
         usage values for that dimension.
     """
+    # resolve the logging level check once rather than per dimension
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
+
     unassigned_usage = usage
     for dimension in metric_dimensions:
         # handle a missing min, as well as allowing usage and min
         # being 0 to generate a billing dimension entry with the
         # appropriate dimension name and a value of 0.
         if 'min' in dimension and usage < dimension['min']:
-            log.debug("Skipping as usage < min")
+            if debug_enabled:
+                log.debug("Skipping as usage < min")
             continue
 
         # if configured min is not specified or 0, use 1 as the
@@ -273,11 +348,12 @@ def get_tiered_dimensions(
         # subtract assigned usage
         unassigned_usage -= dim_usage
 
-        log.debug(
-            "Adding '%s'=%d to billing_dimensions",
-            dimension['dimension'],
-            dim_usage
-        )
+        if debug_enabled:
+            log.debug(
+                "Adding '%s'=%d to billing_dimensions",
+                dimension['dimension'],
+                dim_usage
+            )
 
     # unassigned usage indicates that there is a missing tiered
     # dimension specification in the config
@@ -295,6 +371,15 @@ def get_tiered_dimensions(
         )
 
 
+# map consumption reporting type to appropriate handler routine;
+# built once at import time rather than per get_billing_dimensions()
+# call
+_dimensions_handlers = {
+    'tiered': get_tiered_dimensions,
+    'volume': get_volume_dimensions
+}
+
+
 def get_billing_dimensions(
     config: Config,
     billable_usage: dict,
@@ -332,12 +417,6 @@ def get_billing_dimensions(
         billable_usage
     )
 
-    # map consumption reporting type to appropriate handler routine
-    get_dimensions_handler = {
-        'tiered': get_tiered_dimensions,
-        'volume': get_volume_dimensions
-    }
-
     for usage_metric, usage in billable_usage.items():
         if billing_status.get(usage_metric, {}).get('status') == 'submitted':
             log.debug(
@@ -355,16 +434,16 @@ def get_billing_dimensions(
             usage
         )
 
-        if consumption_reporting not in get_dimensions_handler:
+        if consumption_reporting not in _dimensions_handlers:
             raise ConsumptionReportingInvalidError(
                 "Invalid consumption reporting type "
                 f"'{consumption_reporting}' "
                 f"for usage metric '{usage_metric}'"
             )
 
-        # call the get_dimensions_handler routine matching the
-        # specified consumption reporting type.
-        get_dimensions_handler[consumption_reporting](
+        # call the handler routine matching the specified
+        # consumption reporting type.
+        _dimensions_handlers[consumption_reporting](
             usage_metric,
             usage,
             metric_config['dimensions'],
@@ -445,6 +524,68 @@ def filter_usage_records_in_billing_period(
     return filtered_records
 
 
+def split_usage_records_in_billing_period(
+    usage_records: list,
+    config: Config,
+    billing_period_end: str
+) -> (list, list):
+    """
+    Partitions the 'usage_records' into those that fall within the
+    billing period ending at 'billing_period_end', using the billing
+    period duration specified in 'config', and those that do not.
+
+    Both partitions are built in a single traversal of the records,
+    avoiding a membership scan over the billable records for every
+    retained record.
+
+    :param usage_records: The list of usage records to be partitioned.
+    :param config:
+        The configuration specifying the metrics that need to be
+        processed in the usage records list.
+    :param billing_period_end:
+        The end of the current billing period, which is used to
+        determine the appropriate set of records to select.
+    :return:
+        A tuple of the usage records that fall within the billing
+        period ending at 'billing_period_end' and the remaining
+        usage records.
+    """
+    # determine time range to partition records for
+    range_end = string_to_date(billing_period_end)
+    range_start = get_prev_bill_time(
+        range_end,
+        config.billing_interval
+    )
+
+    start_time = date_to_string(range_start)
+    end_time = date_to_string(range_end)
+
+    log.info(
+        "Partitioning records for %s <= reporting_time < %s",
+        start_time,
+        end_time
+    )
+
+    billable_records = []
+    remaining_records = []
+
+    # bind the append methods once; resolving them per record costs
+    # an attribute lookup per iteration in this hot loop
+    add_billable = billable_records.append
+    add_remaining = remaining_records.append
+
+    for record in usage_records:
+        if start_time <= record['reporting_time'] < end_time:
+            add_billable(record)
+        else:
+            add_remaining(record)
+
+    log.debug("Billable records: %s", billable_records)
+    log.debug("Remaining records: %s", remaining_records)
+
+    return billable_records, remaining_records
+
+
 def get_errors(status: dict) -> list:
     """
     Return a list of all error messages
@@ -536,22 +677,25 @@ def process_metering(
         empty_metering
     )
 
-    # select usage records appropriate for this billing period
     usage_records = cache.get('usage_records', [])
     billing_period_end = cache.get('next_bill_time')
-    billable_records = filter_usage_records_in_billing_period(
-        usage_records,
-        config,
-        billing_period_end
-    )
-    log.debug("Billable records: %s", billable_records)
 
-    # the remaining records not selected as billable
-    remaining_records = [
-        record for record in usage_records
-        if record not in billable_records
-    ]
-    log.debug("Remaining records: %s", remaining_records)
+    if empty_metering and not free_trial:
+        # a zeroed metering submission neither bills usage records
+        # nor rewrites the cached ones, so the partitioning work can
+        # be skipped entirely
+        billable_records = []
+        remaining_records = []
+    else:
+        # partition usage records into those billable in this billing
+        # period and the remaining records, in a single pass
+        billable_records, remaining_records = (
+            split_usage_records_in_billing_period(
+                usage_records,
+                config,
+                billing_period_end
+            )
+        )
 
     # determine billable usage and associated billable dimensions
     billable_usage = get_billable_usage(
@@ -566,11 +710,31 @@ def process_metering(
             billable_usage
         )
 
-        billed_dimensions = get_billing_dimensions(
-            config,
-            billable_usage,
-            cache.get('billing_status', {})
-        )
+        previous_billing_status = cache.get('billing_status', {})
+
+        if empty_metering and not previous_billing_status:
+            # the dimensions for a zero-usage heartbeat depend only
+            # on the static config, so resolve them once and reuse
+            # the result on subsequent heartbeat cycles
+            zero_dimensions = getattr(
+                config,
+                '_zero_billed_dimensions',
+                None
+            )
+            if zero_dimensions is None:
+                zero_dimensions = get_billing_dimensions(
+                    config,
+                    billable_usage
+                )
+                config._zero_billed_dimensions = zero_dimensions
+
+            billed_dimensions = dict(zero_dimensions)
+        else:
+            billed_dimensions = get_billing_dimensions(
+                config,
+                billable_usage,
+                previous_billing_status
+            )
 
         log.debug(
             "Submitting billing for %s",
@@ -15,12 +15,26 @@
 #
 """config.py is part of csp-billing-adapter and defines the Config class"""
 
+import copy
 import logging
+import os
+
 import yaml
-from yaml.parser import ParserError
+
+try:
+    # the libyaml based loader parses significantly faster than the
+    # pure Python one and raises the same exception types
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
 
 log = logging.getLogger('CSPBillingAdapter')
 
+# parsed YAML data per config file, keyed on the file's stat signature
+# so an edited file is transparently re-parsed; only the raw YAML data
+# is cached since plugin provided defaults depend on the hook in use
+_yaml_cache = {}
+
 
 class Config(dict):
     """
@@ -39,34 +53,87 @@ class Config(dict):
 
     def __init__(self, data: dict):
         super().__init__(data)
-        for key, val in data.items():
-            if isinstance(val, (list, tuple, set)):
-                log.debug(
-                    "Converting collection %s to: %s",
-                    repr(val),
-                    self.__class__.__name__
+
+        # nested values are converted lazily by __getattr__ on first
+        # attribute access rather than walking the whole tree here,
+        # so load time and memory no longer scale with config depth
+
+        # resolve frequently consulted nested settings once, so hot
+        # code paths don't repeat the chained dict lookups
+        self.logging_level = self.get('logging', {}).get('level')
+
+        if 'usage_metrics' in self:
+            # precompute the per-metric settings consumed on every
+            # metering cycle; the config is immutable for the process
+            # lifetime so the nested lookups are done once here
+            self._billing_plan = tuple(
+                (
+                    metric,
+                    metric_data.get('usage_aggregation'),
+                    metric_data.get('minimum_consumption', 0)
                 )
-                attr = [self.parse_value(item) for item in val]
-                setattr(self, key, attr)
-            else:
-                setattr(self, key, self.parse_value(val))
+                for metric, metric_data in self['usage_metrics'].items()
+            )
+
+            # bucket the metrics by aggregation method once, so the
+            # metering hot path needs no per-cycle string comparisons
+            self._average_metrics = tuple(
+                metric for metric, aggregation, _ in self._billing_plan
+                if aggregation == 'average'
+            )
+            self._maximum_metrics = tuple(
+                metric for metric, aggregation, _ in self._billing_plan
+                if aggregation == 'maximum'
+            )
 
         log.debug("Config: %s", self)
 
+    def __getattr__(self, key):
+        """
+        Resolve dot notation access against the dict contents.
+
+        Only called when normal attribute lookup fails; the converted
+        value is memoized as an instance attribute so subsequent
+        accesses bypass this method entirely.
+        """
+        try:
+            val = self[key]
+        except KeyError:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no "
+                f"attribute '{key}'"
+            ) from None
+
+        if isinstance(val, (list, tuple, set)):
+            attr = [self.parse_value(item) for item in val]
+        else:
+            attr = self.parse_value(val)
+
+        setattr(self, key, attr)
+
+        return attr
+
     def parse_value(self, item):
         """recursive evaluation if item is a dict"""
+        # checked once so the per-item logging calls cost nothing
+        # at the default log level
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+
         if isinstance(item, dict):
-            log.debug(
-                "Converting dict %s to: %s",
-                item,
-                self.__class__.__name__
-            )
+            if debug_enabled:
+                log.debug(
+                    "Converting dict %s to: %s",
+                    item,
+                    self.__class__.__name__
+                )
             parsed_item = self.__class__(item)
         else:
-            log.debug("Using original item: %s", item)
+            if debug_enabled:
+                log.debug("Using original item: %s", item)
             parsed_item = item
 
-        log.debug("Parsed item: %s", parsed_item)
+        if debug_enabled:
+            log.debug("Parsed item: %s", parsed_item)
 
         return parsed_item
 
@@ -88,11 +155,13 @@ class Config(dict):
 
         log.debug("Config defaults loaded: %s", defaults)
 
-        updated_data = {**defaults, **data}
+        # merge in place on top of the defaults dict built above
+        # instead of unpacking both dicts into a third one
+        defaults.update(data)
 
-        log.debug("Merged config with defaults: %s", updated_data)
+        log.debug("Merged config with defaults: %s", defaults)
 
-        return updated_data
+        return defaults
 
     @classmethod
     def load_from_file(cls, filename, hook):
@@ -112,10 +181,26 @@ class Config(dict):
         """
 
         try:
+            stat = os.stat(filename)
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            # let the open() below raise the expected exception
+            signature = None
+
+        cached = _yaml_cache.get(filename)
+
+        if signature is not None and cached and cached[0] == signature:
+            # deep copy so callers cannot mutate the cached data
+            yaml_data = copy.deepcopy(cached[1])
+        else:
+            # FileNotFoundError and yaml.parser.ParserError propagate
+            # directly to the caller
             with open(filename, 'r', encoding='utf-8') as fh:
-                yaml_data = yaml.safe_load(fh)
-        except (FileNotFoundError, ParserError) as exc:
-            raise exc
+                yaml_data = yaml.load(fh, Loader=YamlSafeLoader)
+
+            if signature is not None:
+                _yaml_cache[filename] = (signature, copy.deepcopy(yaml_data))
+
         log.debug(
             "Loaded YAML %s as: %s",
             filename,
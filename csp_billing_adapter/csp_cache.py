@@ -40,6 +40,22 @@ from csp_billing_adapter.utils import (
 log = logging.getLogger('CSPBillingAdapter')
 
 
+@functools.lru_cache(maxsize=8)
+def _billing_range_start(next_bill_time: str, billing_interval: str):
+    """
+    Determine the start of the billing period ending at next_bill_time.
+
+    Memoized because record_valid() is called for every incoming
+    usage record while both arguments only change when the billing
+    period rolls over, making the timestamp parse and relativedelta
+    arithmetic pure overhead after the first call.
+    """
+    return get_prev_bill_time(
+        string_to_date(next_bill_time),
+        billing_interval
+    )
+
+
 def create_cache(hook, config: Config) -> dict:
     """
     Initialise the cache data store based upon the settings specified
@@ -60,6 +76,7 @@ def create_cache(hook, config: Config) -> dict:
         'next_bill_time': date_to_string(next_bill_time),
         'next_reporting_time': date_to_string(next_reporting_time),
         'usage_records': [],
+        'last_reporting_time': '',
         'last_bill': {},
         'trial_remaining': 1
     }
@@ -103,11 +120,7 @@ def record_valid(
     :param billing_interval:
         The cadence for metering billing.
     """
-    range_end = string_to_date(next_bill_time)
-    range_start = get_prev_bill_time(
-        range_end,
-        billing_interval
-    )
+    range_start = _billing_range_start(next_bill_time, billing_interval)
     return range_start <= string_to_date(reporting_time)
 
 
@@ -128,27 +141,41 @@ def add_usage_record(
     :param billing_interval:
         The cadence for meter billing.
     """
+    # checked once so the per-record log calls, which render the
+    # full record dict, cost nothing when INFO is filtered out
+    info_enabled = log.isEnabledFor(logging.INFO)
+
     valid = record_valid(
         record['reporting_time'],
         cache['next_bill_time'],
         billing_interval
     )
     if not valid:
-        log.info('Skipping invalid usage record: %s', record)
+        if info_enabled:
+            log.info('Skipping invalid usage record: %s', record)
         return
 
-    if not cache.get('usage_records', []):
-        log.info('Appending usage record: %s', record)
-        cache['usage_records'] = [record]
-    else:
-        last_record_time = cache['usage_records'][-1]['reporting_time']
+    reporting_time = record['reporting_time']
+    last_reporting_time = cache.get('last_reporting_time')
+
+    if last_reporting_time is None:
+        # cache predates the last_reporting_time field; fall back to
+        # the tail of the usage records list
+        records = cache.get('usage_records')
+        last_reporting_time = records[-1]['reporting_time'] if records else ''
 
-        # Only include new usage records
-        if record['reporting_time'] != last_record_time:
+    # Only include new usage records
+    if reporting_time != last_reporting_time:
+        if info_enabled:
             log.info('Appending usage record: %s', record)
-            cache['usage_records'].append(record)
+        records = cache.get('usage_records')
+        if records:
+            records.append(record)
         else:
-            log.info('Skipping duplicate usage record: %s', record)
+            cache['usage_records'] = [record]
+        cache['last_reporting_time'] = reporting_time
+    elif info_enabled:
+        log.info('Skipping duplicate usage record: %s', record)
 
 
 def cache_meter_record(
@@ -171,8 +198,12 @@ def cache_meter_record(
     :param dimensions: The billing dimensions submitted to the CSP.
     :param metering_time: The time at which the submission occurred.
     """
-    cache['last_bill'] = {
-        'dimensions': dimensions,
-        'billing_status': billing_status,
-        'metering_time': metering_time
-    }
+    last_bill = cache.get('last_bill')
+    if last_bill is None:
+        last_bill = cache['last_bill'] = {}
+
+    # update the existing dict in place rather than replacing it,
+    # reusing the allocation made by create_cache
+    last_bill['dimensions'] = dimensions
+    last_bill['billing_status'] = billing_status
+    last_bill['metering_time'] = metering_time
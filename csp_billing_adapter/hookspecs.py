@@ -38,7 +38,10 @@ def get_usage_data(config: Config):
     Retrieves the current usage report from API
 
     :param config: The application configuration dictionary
-    :return: Return a hash with the current usage report
+    :return:
+        Return a hash with the current usage report, or a list of
+        such hashes when the plugin has buffered multiple usage
+        samples since the last retrieval.
     """
 
 
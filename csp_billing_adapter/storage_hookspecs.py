@@ -58,6 +58,27 @@ def update_csp_config(
     """
 
 
+@hookspec(firstresult=True)
+def update_csp_config_raw(
+    config: Config,
+    raw_csp_config: bytes,
+    replace: bool
+) -> None:
+    """
+    Update or replace the CSP Support Config in stateful storage
+    from pre-serialized JSON content
+
+    Storage plugins that persist the csp_config as JSON can implement
+    this hook in place of update_csp_config to reuse the bytes that
+    the adapter has already serialized, avoiding a second JSON encode
+    of the same content.
+
+    :param config: The application configuration dictionary
+    :param raw_csp_config: The CSP Support Config as JSON encoded bytes
+    :param replace: If True the dictionary is replaced not updated
+    """
+
+
 @hookspec(firstresult=True)
 def get_cache(config: Config) -> None:
     """
@@ -15,10 +15,10 @@
 #
 """utils.py is part of csp-billing-adapter and provides utility functions"""
 import datetime
+import functools
 from dateutil.relativedelta import relativedelta
 from dateutil import parser
 import logging
-from functools import partial
 import time
 
 
@@ -47,14 +47,28 @@ def date_to_string(date: datetime.datetime) -> str:
     return formatted_date
 
 
+@functools.lru_cache(maxsize=4096)
 def string_to_date(timestamp: str) -> datetime.datetime:
-    """convert string to date"""
+    """
+    convert string to date
+
+    Results are memoized since the same timestamps are re-parsed on
+    every event loop iteration; the cache is sized to cover the
+    reporting timestamps of all cached usage records in addition to
+    recurring entries such as next_bill_time and next_reporting_time.
+    """
     try:
-        parsed_date = parser.parse(timestamp)
-    except ValueError as exc:
-        raise type(exc)(
-            f"Invalid timestamp passed to string_to_date(): {timestamp}") \
-            from exc
+        # timestamps are written with date_to_string() so the fast
+        # ISO-8601 parser handles them; legacy or third party formats
+        # fall back to the much slower dateutil parser
+        parsed_date = datetime.datetime.fromisoformat(timestamp)
+    except ValueError:
+        try:
+            parsed_date = parser.parse(timestamp)
+        except ValueError as exc:
+            raise type(exc)(
+                f"Invalid timestamp passed to string_to_date(): {timestamp}"
+            ) from exc
 
     log.debug("%s parsed to: %s", repr(timestamp), parsed_date)
 
@@ -141,23 +155,28 @@ def get_prev_bill_time(
 
 
 def retry_on_exception(
-    func_call: partial,
+    func_call,
     exceptions=Exception,
     retry_count: int = 3,
     retry_delay: float = 1,
     delay_factor: float = 1,
     logger: logging.Logger = None,
-    func_name: str = None
+    func_name: str = None,
+    func_kwargs: dict = None
 ):
     """
-    Retry the provided function call that has been encapsulated using
-    functools.partial as 'func_call', catching the given 'exceptions',
+    Retry the provided 'func_call', catching the given 'exceptions',
     up to 'retry_count' times, delaying by 'retry_delay' between tries,
     multiplied by 'delay_factor' after each attempt, logging retry
     status messages via 'log' if provided.
 
+    The function call can either be provided as a plain callable with
+    any required arguments passed via 'func_kwargs', avoiding a
+    functools.partial allocation at the call site, or as a callable
+    that has already been encapsulated using functools.partial.
+
     :param func_call:
-        The encapsulated function call that will be retried.
+        The callable that will be retried.
     :param exceptions:
         The exception, or tuple of exceptions, to catch and retry the
         func_call for.
@@ -178,6 +197,9 @@ def retry_on_exception(
     :param func_name:
         An optional function name that will be used for logging
         purposes.
+    :param func_kwargs:
+        An optional dictionary of keyword arguments that func_call
+        will be called with.
 
     :return:
         The result of calling func_call.
@@ -187,11 +209,15 @@ def retry_on_exception(
         # if no specific logger was provided use default log
         logger = log
 
+    if func_kwargs is None:
+        func_kwargs = {}
+
     if func_name is None:
         # if no function name is provided try using the name of
-        # func_call.func, or failing that, 'unnamed_function'
+        # func_call.func (for functools.partial encapsulated calls)
+        # or func_call itself, or failing that, 'unnamed_function'
         func_name = getattr(
-            func_call.func,
+            getattr(func_call, 'func', func_call),
             '__name__',
             'unnamed_function'
         )
@@ -232,7 +258,7 @@ def retry_on_exception(
     while True:
         try:
             logger.debug("Attempting to run '%s'", func_name)
-            return func_call()
+            return func_call(**func_kwargs)
         except exceptions as error:
             logger.debug('%s: Caught exception: %s', func_name, str(error))
 
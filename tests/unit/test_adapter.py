@@ -14,6 +14,8 @@
 # limitations under the License.
 #
 
+import json
+
 from unittest import mock
 
 import pytest
@@ -26,11 +28,16 @@ from csp_billing_adapter import (
     product_api
 )
 from csp_billing_adapter.adapter import (
+    MAX_SKIPPED_CSP_CONFIG_WRITES,
+    csp_config_changed,
     event_loop_handler,
     get_config,
+    get_hot_hook_callers,
     get_plugin_manager,
+    get_plugin_versions,
     initial_adapter_setup,
     main as cba_main,
+    reset_csp_config_hash,
     setup_logging,
     metering_test,
     update_logger_from_config
@@ -48,6 +55,19 @@ from csp_billing_adapter.utils import (
 )
 
 
+@pytest.fixture(autouse=True)
+def csp_config_change_tracking():
+    """
+    Reset the adapter's csp_config change tracking state per test.
+
+    The tracking state is module-global, so without this a test could
+    inherit a content hash recorded by an earlier test and silently
+    skip a csp_config backup it expects to observe.
+    """
+    reset_csp_config_hash()
+    yield
+
+
 def test_adapter_version():
     """Verify the adapter version."""
     assert csp_billing_adapter.__version__ == "1.1.0"
@@ -70,6 +90,78 @@ def test_get_plugin_manager(cba_config):
     assert pm.hook.get_csp_name(config=cba_config) == "local"
 
 
+def test_get_hot_hook_callers(cba_pm, cba_config):
+    """Verify hot hook caller resolution for the event loop hooks."""
+    hot_hooks = get_hot_hook_callers(cba_pm)
+
+    # single-impl firstresult hooks are resolved to the implementing
+    # function, bypassing the pluggy dispatch machinery
+    assert hot_hooks.get_metering_archive is not \
+        cba_pm.hook.get_metering_archive
+    assert hot_hooks.get_metering_archive(config=cba_config) == \
+        cba_pm.hook.get_metering_archive(config=cba_config)
+
+    # without any registered implementations the regular pluggy hook
+    # caller is used as a fallback
+    pm = get_plugin_manager()
+    hot_hooks = get_hot_hook_callers(pm)
+
+    assert hot_hooks.update_cache is pm.hook.update_cache
+
+
+def test_get_plugin_versions(cba_pm, cba_log, tmp_path):
+    """Verify disk caching of the plugin version lookup."""
+    cache_path = str(tmp_path / 'versions.cache')
+
+    with mock.patch(
+        'csp_billing_adapter.adapter.versions_cache_path',
+        cache_path
+    ):
+        # first lookup dispatches the hook and persists the result
+        versions = get_plugin_versions(cba_pm.hook, cba_log)
+        assert versions == dict(cba_pm.hook.get_version())
+
+        # subsequent lookups are answered from the cache file without
+        # re-dispatching the hook
+        with mock.patch.object(cba_pm.hook, 'get_version') as mock_hook:
+            assert get_plugin_versions(cba_pm.hook, cba_log) == versions
+            mock_hook.assert_not_called()
+
+        # a corrupted cache file falls back to calling the hook
+        with open(cache_path, 'w', encoding='utf-8') as cache_file:
+            cache_file.write('not json')
+
+        assert get_plugin_versions(cba_pm.hook, cba_log) == versions
+
+
+def test_csp_config_changed():
+    """Verify change tracking for csp_config datastore backups."""
+    csp_config = {
+        'billing_api_access_ok': True,
+        'timestamp': '2024-01-01T00:00:00+00:00',
+        'errors': []
+    }
+
+    # first check never reports the csp_config as unchanged
+    assert csp_config_changed(csp_config) is True
+
+    # a timestamp only update is reported as unchanged
+    csp_config['timestamp'] = '2024-01-01T01:00:00+00:00'
+    assert csp_config_changed(csp_config) is False
+
+    # any other content change is reported as changed
+    csp_config['errors'] = ['some error']
+    assert csp_config_changed(csp_config) is True
+
+    # after the maximum number of skipped writes a backup is forced
+    results = [
+        csp_config_changed(csp_config)
+        for _ in range(MAX_SKIPPED_CSP_CONFIG_WRITES + 1)
+    ]
+    assert not any(results[:-1])
+    assert results[-1] is True
+
+
 def test_setup_logging():
     """Verify logging is being setup correctly."""
     log = setup_logging()
@@ -381,6 +473,103 @@ def test_event_loop_handler(
     assert csp_config['timestamp'] == date_to_string(event_time)
 
 
+@mock.patch('csp_billing_adapter.utils.time.sleep')
+def test_event_loop_handler_batched_usage_data(
+    mock_sleep,
+    cba_pm,
+    cba_config,
+    cba_log
+):
+    """Verify that a batch of buffered usage samples is drained."""
+    event_time = get_now()
+
+    initial_adapter_setup(cba_pm.hook, cba_config, cba_log)
+    cache = cba_pm.hook.get_cache(config=cba_config)
+    csp_config = cba_pm.hook.get_csp_config(config=cba_config)
+
+    usage_batch = [
+        {
+            'managed_node_count': 3,
+            'reporting_time': date_to_string(event_time),
+            'base_product': 'cpe:/o:suse:product:v1.2.3'
+        },
+        {
+            'managed_node_count': 5,
+            'reporting_time': date_to_string(
+                get_date_delta(event_time, 60)
+            ),
+            'base_product': 'cpe:/o:suse:product:v1.2.3'
+        }
+    ]
+
+    with mock.patch.object(
+        cba_pm.hook,
+        'get_usage_data',
+        return_value=usage_batch
+    ):
+        event_loop_handler(
+            cba_pm.hook,
+            cba_config,
+            cba_log,
+            event_time,
+            cache,
+            csp_config
+        )
+
+    # both buffered samples should have been added to the cache in
+    # a single event loop iteration
+    cache = cba_pm.hook.get_cache(config=cba_config)
+    assert len(cache['usage_records']) == 2
+    assert cache['usage_records'] == usage_batch
+
+    assert csp_config['base_product'] == 'cpe:/o:suse:product:v1.2.3'
+
+
+@mock.patch('csp_billing_adapter.utils.time.sleep')
+def test_event_loop_handler_update_csp_config_raw(
+    mock_sleep,
+    cba_pm,
+    cba_config,
+    cba_log
+):
+    """Verify pre-serialized csp_config updates when supported."""
+
+    class RawCSPConfigPlugin:
+        """Storage plugin accepting pre-serialized csp_config content."""
+
+        def __init__(self):
+            self.raw_csp_config = None
+
+        @csp_billing_adapter.hookimpl
+        def update_csp_config_raw(self, config, raw_csp_config, replace):
+            self.raw_csp_config = raw_csp_config
+
+    raw_plugin = RawCSPConfigPlugin()
+    cba_pm.register(raw_plugin)
+
+    event_time = get_now()
+
+    initial_adapter_setup(cba_pm.hook, cba_config, cba_log)
+    cache = cba_pm.hook.get_cache(config=cba_config)
+    csp_config = cba_pm.hook.get_csp_config(config=cba_config)
+
+    event_loop_handler(
+        cba_pm.hook,
+        cba_config,
+        cba_log,
+        event_time,
+        cache,
+        csp_config
+    )
+
+    # the csp_config should have been serialized once and passed to
+    # the raw storage hook as JSON encoded bytes
+    assert raw_plugin.raw_csp_config is not None
+
+    raw_content = json.loads(raw_plugin.raw_csp_config)
+    assert raw_content['timestamp'] == date_to_string(event_time)
+
+
 @mock.patch('csp_billing_adapter.utils.time.sleep')
 def test_event_loop_handler_usage_data_error(
     mock_sleep,
@@ -516,8 +705,61 @@ def test_event_loop_handler_update_csp_config_error(
         assert csp_config['timestamp'] == date_to_string(event_time)
 
 
+@mock.patch('csp_billing_adapter.utils.time.sleep')
+def test_event_loop_handler_csp_config_write_retried(
+    mock_sleep,
+    cba_pm,
+    cba_config,
+    cba_log,
+    caplog
+):
+    event_time = get_now()
+
+    error = Exception("Simulated failed update_csp_config() Error")
+
+    initial_adapter_setup(cba_pm.hook, cba_config, cba_log)
+    cache = cba_pm.hook.get_cache(config=cba_config)
+    csp_config = cba_pm.hook.get_csp_config(config=cba_config)
+
+    with mock.patch.object(
+        cba_pm.hook,
+        'update_csp_config',
+        side_effect=error
+    ):
+        event_loop_handler(
+            cba_pm.hook,
+            cba_config,
+            cba_log,
+            event_time,
+            cache,
+            csp_config
+        )
+
+        # confirm that csp_config's errors list contains expected error
+        assert f'csp_config failed to save: {error}' in csp_config['errors']
+
+    # the write never reached the datastore, so the next iteration
+    # must re-attempt the backup even though the csp_config content
+    # is otherwise unchanged, rather than skipping on a hash match
+    # against the never persisted state
+    with mock.patch.object(
+        cba_pm.hook,
+        'update_csp_config'
+    ) as mock_update_csp_config:
+        event_loop_handler(
+            cba_pm.hook,
+            cba_config,
+            cba_log,
+            event_time,
+            cache,
+            csp_config
+        )
+
+        mock_update_csp_config.assert_called_once()
+
+
 @mock.patch('csp_billing_adapter.local_csp.randrange')
-@mock.patch('csp_billing_adapter.adapter.time.sleep')
+@mock.patch('csp_billing_adapter.adapter.asyncio.sleep')
 @mock.patch('csp_billing_adapter.adapter.get_plugin_manager')
 @mock.patch('csp_billing_adapter.adapter.get_config')
 def test_main(
@@ -533,7 +775,7 @@ def test_main(
     mock_get_config.return_value = cba_config
     mock_rand.return_value = 0
 
-    # test catching Ctrl-C from time.sleep()
+    # test catching Ctrl-C from asyncio.sleep()
     mock_sleep.side_effect = KeyboardInterrupt('Mock Ctrl-C')
 
     with pytest.raises(SystemExit) as e:
@@ -740,9 +982,11 @@ def test_metering_test_meter_billing_and_update_csp_config_failure(
 @mock.patch('csp_billing_adapter.adapter.get_config')
 @mock.patch('csp_billing_adapter.adapter.event_loop_handler')
 @mock.patch('csp_billing_adapter.adapter.get_now')
-@mock.patch('csp_billing_adapter.adapter.time.sleep')
+@mock.patch('csp_billing_adapter.adapter.time')
+@mock.patch('csp_billing_adapter.adapter.asyncio.sleep')
 def test_main_sleep(
     mock_sleep,
+    mock_time,
     mock_get_now,
     mock_event_loop_handler,
     mock_get_config,
@@ -754,19 +998,14 @@ def test_main_sleep(
     caplog
 ):
     now = get_now()
+    loop_start = 100.0
     processing_delay = 1.23
 
-    # calculate the time when event loop "started"
-    event_time = get_date_delta(
-        now,
-        -processing_delay
-    )
-
     # this is the debug level message we expect to see in the log,
     # and debug level is enabled for the cba_log fixture
     expected_log_msg = (
         "Sleeping for %g seconds" % (
-            cba_config.query_interval - (now - event_time).total_seconds()
+            cba_config.query_interval - processing_delay
         )
     )
 
@@ -776,12 +1015,20 @@ def test_main_sleep(
     mock_get_config.return_value = cba_config
     mock_event_loop_handler.return_value = None
 
-    # get_now() is called at the start of the main loop, and again to
-    # get the current time to determine how much time to sleep for.
-    mock_get_now.side_effect = [now, event_time, now]
+    # get_now() is called by metering_test() and again at the start
+    # of the main loop.
+    mock_get_now.side_effect = [now, now]
+
+    # time.monotonic() is called to determine the iteration deadline
+    # before the event loop handler runs, and again afterwards to
+    # determine how much time remains until that deadline.
+    mock_time.monotonic.side_effect = [
+        loop_start,
+        loop_start + processing_delay
+    ]
 
-    # time.sleep is called before the main loop runs, which needs to
-    # succeed, but the next call, at the end of the main loop should
+    # asyncio.sleep is awaited before the main loop runs, which needs
+    # to succeed, but the next call, at the end of the main loop should
     # fail leading to SystemExit with exit status of 0.
     mock_sleep.side_effect = [
         None,
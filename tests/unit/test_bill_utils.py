@@ -36,6 +36,7 @@ from csp_billing_adapter.bill_utils import (
     get_tiered_dimensions,
     get_volume_dimensions,
     process_metering,
+    split_usage_records_in_billing_period,
     get_errors,
     create_billing_status
 )
@@ -175,6 +176,28 @@ def gen_mixed_usage_records(
 
 
 # test routines
+def test_split_usage_records_in_billing_period(cba_config):
+    now = get_now()
+    usage_records = gen_mixed_usage_records(
+        now,
+        cba_config,
+        billing_period_only=False
+    )
+
+    billable_records, remaining_records = (
+        split_usage_records_in_billing_period(
+            usage_records,
+            cba_config,
+            date_to_string(now)
+        )
+    )
+
+    # the first record predates the billing period and the last one
+    # postdates it; the records in between are billable
+    assert billable_records == usage_records[1:-1]
+    assert remaining_records == [usage_records[0], usage_records[-1]]
+
+
 def test_get_average_usage():
     metric1 = "dim1"
     usage_records1 = [
@@ -50,6 +50,16 @@ def test_get_config_from_missing_config_file():
         )
 
 
+def test_config_logging_level():
+    """Test that the nested logging level is resolved at load time."""
+
+    config = Config({'logging': {'level': 'DEBUG'}})
+    assert config.logging_level == 'DEBUG'
+
+    config = Config({})
+    assert config.logging_level is None
+
+
 def test_get_config_from_bad_config_file():
     """Test reading a config file with invalid yaml formatting"""
 
@@ -57,6 +57,17 @@ def test_bad_string_to_date():
         utils.string_to_date('foo')
 
 
+def test_string_to_date_is_memoized():
+    """Test that utils.string_to_date caches parsed results"""
+    utils.string_to_date.cache_clear()
+
+    first = utils.string_to_date('2023-04-20T13:08:30')
+    second = utils.string_to_date('2023-04-20T13:08:30')
+
+    assert first == second
+    assert utils.string_to_date.cache_info().hits == 1
+
+
 def test_good_get_date_delta():
     """Test working utils.get_date_delta"""
     assert utils.get_date_delta(